@@ -1,184 +1,501 @@
 import os
 import time
-import json
+import random
 import base64
+import hashlib
+import gzip
+import math
+import re
+import threading
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import argparse
-import requests
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import msgspec
+import orjson
+import httpx
+from cachetools import TTLCache
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
 #
 # # Load .env file if it exists
 load_dotenv()
 
-# Configure logging to console and file
+# Configure logging to console and file; records are handed to a background
+# listener thread so console/disk writes stay off the request path
 log_file = "app.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),  # Console
-        logging.FileHandler(log_file)  # File
-    ]
-)
+log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+console_handler = logging.StreamHandler()  # Console
+console_handler.setFormatter(log_formatter)
+file_handler = logging.FileHandler(log_file)  # File
+file_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, console_handler, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+# httpx logs every request at INFO; keep only its warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # Replace with your actual credentials
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 JIRA_USER_EMAIL = os.getenv("JIRA_USER_EMAIL")
 JIRA_DOMAIN = os.getenv("JIRA_DOMAIN")
+# Point OPENAI_BASE_URL at any OpenAI-compatible server (e.g. a local vLLM) to use it instead
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+logger.debug("env loaded: jira_domain=%s openai_base_url=%s", JIRA_DOMAIN, OPENAI_BASE_URL)
+
+# Shared HTTP/2 client so concurrent OpenAI and Jira calls multiplex over
+# kept-alive connections; retries are handled at the application layer.
+# Timeouts stop a stalled upstream from holding a worker indefinitely.
+# One pool (no per-host mounts) so httpx still applies HTTPS_PROXY/NO_PROXY.
+CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=64),
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    headers={"Content-Type": "application/json"},
+)
+# Request bodies larger than this are gzip-compressed before sending
+GZIP_MIN_BYTES = 1024
+
+# Auth headers, computed once at startup instead of per request
+JIRA_AUTH_HEADER = "Basic " + base64.b64encode(f"{JIRA_USER_EMAIL}:{JIRA_API_TOKEN}".encode()).decode()
+JIRA_HEADERS = {"Authorization": JIRA_AUTH_HEADER}
+OPENAI_HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+# Set JIRA_NOTIFY_USERS=false to suppress notification emails on edits. Jira only
+# accepts that from tokens with Administer Jira/Projects permission, so it is opt-in.
+JIRA_NOTIFY_USERS = os.getenv("JIRA_NOTIFY_USERS", "").strip().lower()
+if JIRA_NOTIFY_USERS in ("true", "1", "yes", "on"):
+    JIRA_UPDATE_PARAMS = {"notifyUsers": "true"}
+elif JIRA_NOTIFY_USERS in ("false", "0", "no", "off"):
+    JIRA_UPDATE_PARAMS = {"notifyUsers": "false"}
+elif not JIRA_NOTIFY_USERS:
+    JIRA_UPDATE_PARAMS = {}
+else:
+    raise ValueError(f"JIRA_NOTIFY_USERS must be true or false, got {JIRA_NOTIFY_USERS!r}")
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outbound requests.
+
+    Holds at most `burst` tokens (default: one second's worth) and starts full,
+    so only a small burst goes out unpaced.
+    """
+
+    def __init__(self, rate, per=60.0, burst=None):
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        self.fill_rate = rate / per
+        self.capacity = burst if burst is not None else max(1.0, self.fill_rate)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait_time)
+
+
+# Client-side pacing to stay under the account's OpenAI requests-per-minute limit.
+# OPENAI_RPM is the account-wide budget; it is split evenly across the gunicorn
+# workers (WEB_CONCURRENCY, set by the Procfile) since each process has its own bucket.
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "3500"))
+if OPENAI_RPM <= 0:
+    raise ValueError(f"OPENAI_RPM must be a positive integer, got {OPENAI_RPM}")
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+OPENAI_RATE_LIMITER = TokenBucket(OPENAI_RPM / WEB_CONCURRENCY)
+
+
+def _backoff_delay(attempt, cap=30):
+    """Exponential backoff with jitter so concurrent workers don't retry in lockstep."""
+    return random.uniform(0.5, 1.5) * min(cap, 2 ** attempt)
+
+
+def _retry_after_delay(resp, attempt, cap=30):
+    """Use the server's Retry-After header (clamped to [0, cap]) when numeric, else jittered backoff."""
+    retry_after = resp.headers.get("Retry-After")
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        return _backoff_delay(attempt, cap)
+    if not math.isfinite(delay):
+        return _backoff_delay(attempt, cap)
+    return min(max(delay, 0.0), cap)
+
+
+def _read_stream(resp):
+    """Assemble the message content from an OpenAI server-sent event stream."""
+    parts = []
+    for line in resp.iter_lines():
+        if not line.startswith("data: "):
+            continue
+        data = line[len("data: "):]
+        if data == "[DONE]":
+            break
+        choices = orjson.loads(data)["choices"]
+        if choices:
+            parts.append(choices[0]["delta"].get("content") or "")
+    return "".join(parts)
+
 
 def call_openai_with_retry(payload, headers, max_retries=5):
-    """Call OpenAI with retry on 429 Too Many Requests."""
-    url = "https://api.openai.com/v1/chat/completions"
+    """Stream a chat completion from OpenAI, retrying on 429 Too Many Requests, 5xx and network errors.
+
+    Other 4xx responses raise httpx.HTTPStatusError immediately. Returns the assembled message content.
+    """
+    url = f"{OPENAI_BASE_URL}/chat/completions"
+    body = orjson.dumps({**payload, "stream": True})
     for attempt in range(max_retries):
+        OPENAI_RATE_LIMITER.acquire()
         try:
-            resp = requests.post(url, headers=headers, json=payload)
-            if resp.status_code == 429:
-                wait_time = 2 ** attempt  # exponential backoff
-                logging.warning(f"Rate limited (429). Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-                continue
-            resp.raise_for_status()
-            logging.info("OpenAI API call successful")
-            return resp
-        except requests.exceptions.RequestException as e:
-            logging.error(f"OpenAI API request failed: {e}")
-            time.sleep(2 ** attempt)
-    raise Exception("Failed after retries due to rate limits")
-
-
-def generate_report(description):
-    """Call OpenAI to generate a structured Jira report from description."""
-    prompt = f"""You are an experienced Jira assistant helping to write high-quality, detailed issue reports.
-                     Given the following user-written bug report, your task is to:
-                        1. Create a professional Jira issue title.
-                        2. Write a detailed description including:
-                                    - A clear summary of the issue
-                                    - Fully detailed step-by-step reproduction steps
-                                    - Specific form fields (e.g. project name, owner, description) where relevant
-                                    - Expected and actual results
-
-        Input:
-
-        \"\"\"{description}\"\"\"
-
-        Respond in JSON format:
-        {{
-          "title": "<Improved title>",
-          "description": "### Summary:\\n<summary>\\n\\n### Steps to Reproduce:\\n1. <step>\\n2. <step>\\n...\\n\\n### Expected Result:\\n<expected>\\n\\n### Actual Result:\\n<actual>"
-        }}"""
-
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "Content-Type": "application/json"
-    }
+            wait_time = None
+            with CLIENT.stream("POST", url, headers=headers, content=body) as resp:
+                if resp.status_code == 429 or resp.status_code >= 500:
+                    wait_time = _retry_after_delay(resp, attempt)
+                    error = f"OpenAI returned {resp.status_code}"
+                else:
+                    resp.raise_for_status()
+                    content = _read_stream(resp)
+        except httpx.TransportError as e:
+            wait_time = _backoff_delay(attempt)
+            error = f"OpenAI API request failed: {e}"
+        if wait_time is None:
+            logger.info("OpenAI API call successful")
+            return content
+        if attempt + 1 == max_retries:
+            logger.error(f"{error} (attempt {attempt + 1}/{max_retries})")
+            break
+        # Back off only after the stream is closed so the connection isn't held open while waiting
+        logger.warning(f"{error} (attempt {attempt + 1}/{max_retries}). Retrying in {wait_time:.2f} seconds...")
+        time.sleep(wait_time)
+    raise Exception(f"OpenAI request failed after {max_retries} attempts: {error}")
+
+
+# Generated reports keyed by description hash; Jira often fires duplicate webhooks
+REPORT_CACHE_TTL = 3600
+REPORT_CACHE = TTLCache(maxsize=1024, ttl=REPORT_CACHE_TTL)
+REPORT_CACHE_LOCK = threading.Lock()
+REPORT_CACHE_MIN_LENGTH = 20
+
+
+# Optional semantic cache for near-duplicate descriptions (requires redisvl)
+SEMANTIC_CACHE_REDIS_URL = os.getenv("SEMANTIC_CACHE_REDIS_URL")
+# Bump when the prompt or response schema changes so stale reports aren't served
+REPORT_PROMPT_VERSION = 1
+semantic_cache = None
+if SEMANTIC_CACHE_REDIS_URL:
+    try:
+        from redisvl.extensions.cache.llm import SemanticCache
+        from redisvl.utils.vectorize import HFTextVectorizer
+
+        semantic_cache = SemanticCache(
+            # Separate index per model/prompt version; Redis names allow only a safe charset
+            name=f"jira_reports_v{REPORT_PROMPT_VERSION}_{re.sub(r'[^A-Za-z0-9]+', '_', OPENAI_MODEL)}",
+            redis_url=SEMANTIC_CACHE_REDIS_URL,
+            distance_threshold=0.1,
+            ttl=REPORT_CACHE_TTL,
+            vectorizer=HFTextVectorizer("redis/langcache-embed-v1"),
+        )
+    except Exception as e:
+        logger.warning(f"Semantic cache disabled, setup failed: {e}")
+        semantic_cache = None
 
-    payload = {
-        "model": "gpt-3.5-turbo",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.3
-    }
 
-    openai_resp = call_openai_with_retry(payload, headers)
-    openai_content = openai_resp.json()["choices"][0]["message"]["content"]
-    parsed = json.loads(openai_content)
-    logging.info("OpenAI report parsed successfully")
-    return parsed
+def _report_cache_key(description):
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+def generate_report(description, no_cache=False):
+    """Generate a structured Jira report from description, reusing cached results."""
+    use_cache = not no_cache and len(description) >= REPORT_CACHE_MIN_LENGTH
+    if use_cache:
+        key = _report_cache_key(description)
+        with REPORT_CACHE_LOCK:
+            cached = REPORT_CACHE.get(key)
+        if cached is not None:
+            logger.info("Report cache hit")
+            return dict(cached)
 
+    if use_cache and semantic_cache is not None:
+        try:
+            hit = semantic_cache.check(prompt=description)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            hit = None
+        if hit:
+            logger.info("Semantic cache hit")
+            parsed = orjson.loads(hit[0]["response"])
+            with REPORT_CACHE_LOCK:
+                REPORT_CACHE[key] = dict(parsed)
+            return parsed
+
+    parsed = _request_report(description)
+
+    if use_cache:
+        with REPORT_CACHE_LOCK:
+            REPORT_CACHE[key] = dict(parsed)
+        if semantic_cache is not None:
+            try:
+                semantic_cache.store(prompt=description, response=orjson.dumps(parsed).decode())
+            except Exception as e:
+                logger.warning(f"Semantic cache store failed: {e}")
+    return parsed
 
-def update_jira(issue_key, new_title, new_description):
-    """Update a Jira issue with the generated content."""
-    logging.info(f"Updating Jira issue {issue_key}")
-    credentials = f"{JIRA_USER_EMAIL}:{JIRA_API_TOKEN}"
-    encoded_token = base64.b64encode(credentials.encode()).decode()
 
-    headers = {
-        "Authorization": f"Basic {encoded_token}",
-        "Content-Type": "application/json"
+# Instructions go in a fixed system message ahead of the user's description so
+# every request shares an identical prefix, which the provider can prompt-cache
+SYSTEM_PROMPT = """You are an experienced Jira assistant helping to write high-quality, detailed issue reports.
+Given a user-written bug report, your task is to:
+    1. Create a professional Jira issue title.
+    2. Write a detailed description including:
+        - A clear summary of the issue
+        - Fully detailed step-by-step reproduction steps
+        - Specific form fields (e.g. project name, owner, description) where relevant
+        - Expected and actual results"""
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+# Structured output: the API guarantees a reply matching this schema, so the
+# prompt no longer needs to spell out the JSON format
+REPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "description": "Improved Jira issue title"},
+        "description": {
+            "type": "string",
+            "description": "Markdown with sections: ### Summary, ### Steps to Reproduce (numbered), "
+                           "### Expected Result, ### Actual Result"
+        }
+    },
+    "required": ["title", "description"],
+    "additionalProperties": False
+}
+PAYLOAD_TEMPLATE = {
+    "model": OPENAI_MODEL,
+    "temperature": 0.3,
+    "response_format": {
+        "type": "json_schema",
+        "json_schema": {"name": "jira_report", "strict": True, "schema": REPORT_SCHEMA}
     }
+}
+
+
+def _request_report(description):
+    """Call OpenAI to generate a structured Jira report from description."""
+    payload = {**PAYLOAD_TEMPLATE, "messages": [SYSTEM_MESSAGE, {"role": "user", "content": description}]}
+
+    openai_content = call_openai_with_retry(payload, OPENAI_HEADERS)
+    parsed = orjson.loads(openai_content)
+    logger.info("OpenAI report parsed successfully")
+    return parsed
+
+
+def update_jira(issue_key, new_title, new_description, current_description=None):
+    """Update a Jira issue with the generated content.
 
+    The description is left out of the update when it matches current_description.
+    """
+    logger.info(f"Updating Jira issue {issue_key}")
     update_url = f"{JIRA_DOMAIN}/rest/api/3/issue/{issue_key}"
-    logging.info(f"PUT {update_url}")
+    logger.info(f"PUT {update_url}")
     # print("🔄 Updating Jira Issue at:", update_url)
 
-    update_resp = requests.put(
-        update_url,
-        headers=headers,
-        json={
-            "fields": {
-                "summary": new_title,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
+    fields = {"summary": new_title}
+    if new_description != current_description:
+        fields["description"] = {
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {
+                    "type": "paragraph",
                     "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": new_description}
-                            ]
-                        }
+                        {"type": "text", "text": new_description}
                     ]
                 }
-            }
+            ]
         }
+
+    body = orjson.dumps({"fields": fields})
+    headers = JIRA_HEADERS
+    if len(body) > GZIP_MIN_BYTES:
+        body = gzip.compress(body)
+        headers = {**JIRA_HEADERS, "Content-Encoding": "gzip"}
+
+    update_resp = CLIENT.put(
+        update_url,
+        params=JIRA_UPDATE_PARAMS,
+        headers=headers,
+        content=body
     )
-    logging.info(f"Jira response status: {update_resp.status_code}")
-    logging.info(f"Jira response text: {update_resp.text}")
+    logger.info(f"Jira response status: {update_resp.status_code}")
     update_resp.raise_for_status()
     return update_resp
 
 
+# Worker pool for Jira webhook processing
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("WORKER_THREADS", "8")))
+
+
+def warm_connections():
+    """Open pooled connections to OpenAI and Jira ahead of the first webhook.
+
+    Called at server startup (the __main__ server branch, or gunicorn's
+    post_worker_init hook in gunicorn.conf.py), never on import.
+    """
+    for url in (OPENAI_BASE_URL, JIRA_DOMAIN):
+        if not url:
+            continue
+        try:
+            CLIENT.head(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"Connection warm-up to {url} failed: {e}")
+
+
+def _log_task_failure(future):
+    """Log an exception that escaped a background task; its future is otherwise discarded."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background task failed", exc_info=exc)
+
+
+def process_issue(issue_key, description, max_retries=5):
+    """Generate a report for a Jira issue and write it back.
+
+    The report is generated once (OpenAI calls retry on their own); the Jira update is
+    retried on network errors, 429 and 5xx only.
+    """
+    try:
+        parsed = generate_report(description)
+        new_title = parsed.get("title", "No Title Generated")
+        new_description = parsed.get("description", "No Description Provided")
+    except Exception:
+        logger.exception(f"Error generating report for issue {issue_key}")
+        return
+
+    for attempt in range(max_retries):
+        try:
+            update_jira(issue_key, new_title, new_description, current_description=description)
+            logger.info(f"Issue {issue_key} updated successfully")
+            return
+        except httpx.HTTPStatusError as e:
+            error = e
+            status = e.response.status_code
+            if status != 429 and status < 500:
+                logger.error(f"Jira rejected update for issue {issue_key} ({status}), not retrying: {e}")
+                return
+            wait_time = _retry_after_delay(e.response, attempt)
+        except httpx.TransportError as e:
+            error = e
+            wait_time = _backoff_delay(attempt)
+        except Exception:
+            logger.exception(f"Error updating issue {issue_key}")
+            return
+        if attempt + 1 == max_retries:
+            logger.error(f"Updating issue {issue_key} failed (attempt {attempt + 1}/{max_retries}): {error}")
+            break
+        logger.error(f"Updating issue {issue_key} failed (attempt {attempt + 1}/{max_retries}): {error}. "
+                     f"Retrying in {wait_time:.2f} seconds...")
+        time.sleep(wait_time)
+    logger.error(f"Giving up on issue {issue_key} after {max_retries} attempts")
+
+
+class JiraFields(msgspec.Struct):
+    description: Optional[str] = None
+
+
+class JiraIssue(msgspec.Struct):
+    key: str
+    fields: JiraFields = msgspec.field(default_factory=JiraFields)
+
+
+class WebhookPayload(msgspec.Struct):
+    """Jira webhook body, or a direct request carrying only a description."""
+    issue: Optional[JiraIssue] = None
+    description: Optional[str] = None
+
+
 @app.route("/", methods=["POST"])
 def webhook():
-    data = request.json
+    body = request.get_data()
     # print("📩 Received payload:", data)
-    logging.info(f"Received webhook payload: {data}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received webhook payload: %s", body)
 
-    if not data:
-        logging.error("No JSON payload received")
+    if not body:
+        logger.error("No JSON payload received")
         return jsonify({"status": "error", "message": "No JSON payload received"}), 400
 
     try:
-        description = None
+        payload = msgspec.json.decode(body, type=WebhookPayload)
+    except msgspec.DecodeError as e:
+        logger.error(f"Invalid webhook payload: {e}")
+        return jsonify({"status": "error", "message": f"Invalid payload: {e}"}), 400
+
+    try:
         issue_key = None
 
         # Case 1: Jira webhook payload
-        if "issue" in data and "key" in data["issue"]:
-            issue = data["issue"]
-            issue_key = issue["key"]
-            description = issue["fields"].get("description", "")
+        if payload.issue is not None:
+            issue_key = payload.issue.key
+            description = payload.issue.fields.description
         # Case 2: Direct input (no Jira key)
-        elif "description" in data:
-            description = data["description"]
+        else:
+            description = payload.description
 
         if not description:
-            logging.warning("Empty description, skipping OpenAI call")
+            logger.warning("Empty description, skipping OpenAI call")
             return jsonify({"status": "skipped", "message": "Empty description"}), 200
 
+        if issue_key:
+            # Jira retries slow webhooks, so acknowledge now and update the issue in the background
+            executor.submit(process_issue, issue_key, description).add_done_callback(_log_task_failure)
+            logger.info(f"Queued issue {issue_key} for processing")
+            return jsonify({"status": "accepted", "issue_key": issue_key}), 202
+
+        # Console-only mode
         parsed = generate_report(description)
         new_title = parsed.get("title", "No Title Generated")
         new_description = parsed.get("description", "No Description Provided")
 
-        if not issue_key:  # Console-only mode
-            logging.info("Outputting generated report to console (no Jira update)")
-            print("\n===== Generated Output (API Console Mode) =====")
-            print("Title:", new_title)
-            print("Description:\n", new_description)
-            return jsonify({"status": "success", "title": new_title, "description": new_description}), 200
-
-        # Otherwise update Jira
-        update_resp = update_jira(issue_key, new_title, new_description)
-        if update_resp.status_code == 204 or not update_resp.text.strip():
-            jira_response = {"message": "Issue updated successfully. (No content returned from Jira)"}
-        else:
-            jira_response = update_resp.json()
-
-        return jsonify({"status": "success", "jira_response": jira_response})
+        logger.info("Outputting generated report to console (no Jira update)")
+        print("\n===== Generated Output (API Console Mode) =====")
+        print("Title:", new_title)
+        print("Description:\n", new_description)
+        return jsonify({"status": "success", "title": new_title, "description": new_description}), 200
 
     except Exception as e:
-        logging.exception("Error processing request")
+        logger.exception("Error processing request")
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
@@ -191,7 +508,7 @@ if __name__ == "__main__":
 
     if args.description:
         # Command-line mode
-        logging.info("Running in CLI mode")
+        logger.info("Running in CLI mode")
         # print("🚀 Running in CLI mode...\n")
         parsed = generate_report(args.description)
         print("===== Generated Output (CLI Mode) =====")
@@ -199,132 +516,7 @@ if __name__ == "__main__":
         print("Description:\n", parsed.get("description"))
     else:
         # Run as Flask API
-        logging.info(f"Starting Flask server on port {args.port}")
+        logger.info(f"Starting Flask server on port {args.port}")
         # print(f"🌍 Starting Flask server on port {args.port}")
+        executor.submit(warm_connections).add_done_callback(_log_task_failure)
         app.run(host="0.0.0.0", port=args.port)
-
-# @app.route("/jira-webhook", methods=["POST"])
-# def jira_webhook():
-#     data = request.json
-#     print("Received payload:", data)  # <--- This line logs the JSON payload
-#
-#     if not data:
-#         return jsonify({"status": "error", "message": "No JSON payload received"}), 400
-#
-#     try:
-#         issue = data.get("issue")
-#         if not issue or "key" not in issue:
-#             return jsonify({"status": "error", "message": "Missing issue or issue key"}), 400
-#         issue_key = issue["key"]
-#         print("Issue key:", issue_key)
-#         description = issue["fields"].get("description", "")
-#         print("Description:", description)
-#         if not description:
-#             return jsonify({"status": "skipped", "message": "Empty description. Skipping OpenAI call."}), 200
-#
-#         if not issue_key:
-#             return jsonify({"status": "error", "message": "Missing issue key"}), 400
-#
-#
-#         # Prepare prompt for OpenAI
-#         prompt = f"""You are an experienced Jira assistant helping to write high-quality, detailed issue reports.
-#                      Given the following user-written bug report, your task is to:
-#                         1. Create a professional Jira issue title.
-#                         2. Write a detailed description including:
-#                                     - A clear summary of the issue
-#                                     - Fully detailed step-by-step reproduction steps
-#                                     - Specific form fields (e.g. project name, owner, description) where relevant
-#                                     - Expected and actual results
-#
-# If the user did not specify exact field names, you may intelligently infer commonly required fields in enterprise applications.
-# Input:
-#
-# \"\"\"
-# {description}
-# \"\"\"
-#
-# Respond in JSON format:
-# {{
-#   "title": "<Improved title>",
-#   "description": "### Summary:\\n<summary>\\n\\n### Steps to Reproduce:\\n1. <step>\\n2. <step>\\n...\\n\\n### Expected Result:\\n<expected>\\n\\n### Actual Result:\\n<actual>"
-# }}"""
-#
-#         # Call OpenAI Chat Completion API
-#         openai_resp = requests.post(
-#             "https://api.openai.com/v1/chat/completions",
-#             headers={
-#                 "Authorization": f"Bearer {OPENAI_API_KEY}",
-#                 "Content-Type": "application/json"
-#             },
-#             json={
-#                 "model": "gpt-3.5-turbo",  # or "gpt-4"
-#                 "messages": [{"role": "user", "content": prompt}],
-#                 "temperature": 0.3
-#             }
-#         )
-#
-#         print("OpenAI status code:", openai_resp.status_code)
-#         print("OpenAI response:", openai_resp.text)
-#
-#         openai_resp.raise_for_status()
-#         openai_content = openai_resp.json()["choices"][0]["message"]["content"]
-#
-#         # Parse OpenAI JSON response
-#         parsed = json.loads(openai_content)
-#         new_title = parsed.get("title", "No Title Generated")
-#         new_description = parsed.get("description", "No Description Provided")
-#
-#         # Encode Jira credentials
-#         credentials = f"{JIRA_USER_EMAIL}:{JIRA_API_TOKEN}"
-#         print("cred:", credentials)
-#         encoded_token = base64.b64encode(credentials.encode()).decode()
-#         print("base 64:", encoded_token)
-#
-#         # Prepare headers
-#         headers = {
-#             "Authorization": f"Basic {encoded_token}",
-#             "Content-Type": "application/json"
-#         }
-#
-#         update_url = f"{JIRA_DOMAIN}/rest/api/3/issue/{issue_key}"
-#         print("Updating Jira Issue at:", update_url)  # Add this line
-#         # Update Jira issue
-#         update_resp = requests.put(update_url,
-#                                    headers=headers,
-#                                    json={
-#         "fields": {
-#             "summary": new_title,
-#             "description": {
-#                 "type": "doc",
-#                 "version": 1,
-#                 "content": [
-#                     {
-#                         "type": "paragraph",
-#                         "content": [
-#                             {
-#                                 "type": "text",
-#                                 "text": new_description
-#                             }
-#                         ]
-#                     }
-#                 ]
-#             }
-#         }
-#     }
-#                                    )
-#         print("Jira status code:", update_resp.status_code)
-#         print("Jira response:", update_resp.text)
-#         update_resp.raise_for_status()
-#         if update_resp.status_code == 204 or not update_resp.text.strip():
-#             jira_response = {"message": "Issue updated successfully. (No content returned from Jira)"}
-#         else:
-#             jira_response = update_resp.json()
-#         return jsonify({"status": "success", "jira_response": jira_response})
-#
-#     except Exception as e:
-#         return jsonify({"status": "error", "message": str(e)}), 500
-#
-#
-# if __name__ == "__main__":
-#     # Open ngrok tunnel
-#     app.run(host="0.0.0.0", port=8000)
\ No newline at end of file
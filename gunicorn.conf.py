@@ -0,0 +1,8 @@
+# gunicorn loads this file automatically from the working directory.
+
+
+def post_worker_init(worker):
+    # Runs in each worker after the app is loaded (and after gevent patching)
+    from app import _log_task_failure, executor, warm_connections
+
+    executor.submit(warm_connections).add_done_callback(_log_task_failure)